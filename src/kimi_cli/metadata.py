@@ -1,4 +1,6 @@
-import json
+import contextlib
+import os
+import tempfile
 from hashlib import md5
 from pathlib import Path
 
@@ -23,6 +25,7 @@ class WorkDirMeta(BaseModel):
 
     @property
     def sessions_dir(self) -> Path:
+        # md5 only derives a stable directory name; changing the hash would orphan existing sessions
         path = get_share_dir() / "sessions" / md5(self.path.encode()).hexdigest()
         path.mkdir(parents=True, exist_ok=True)
         return path
@@ -42,13 +45,20 @@ def load_metadata() -> Metadata:
     if not metadata_file.exists():
         logger.debug("No metadata file found, creating empty metadata")
         return Metadata()
-    with open(metadata_file, encoding="utf-8") as f:
-        data = json.load(f)
-        return Metadata(**data)
+    with open(metadata_file, "rb") as f:
+        return Metadata.model_validate_json(f.read())
 
 
 def save_metadata(metadata: Metadata):
     metadata_file = get_metadata_file()
     logger.debug("Saving metadata to file: {file}", file=metadata_file)
-    with open(metadata_file, "w", encoding="utf-8") as f:
-        json.dump(metadata.model_dump(), f, indent=2, ensure_ascii=False)
+    # write to a temporary file and rename it, so a crash never leaves a partial `kimi.json`
+    fd, tmp_file = tempfile.mkstemp(dir=metadata_file.parent, prefix="kimi.json.", suffix=".tmp")
+    try:
+        with open(fd, "wb") as f:
+            f.write(metadata.model_dump_json(indent=2).encode("utf-8"))
+        os.replace(tmp_file, metadata_file)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_file)
+        raise
@@ -1,15 +1,37 @@
 import json
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from pathlib import Path
 
 import aiofiles
 import aiofiles.os
+import orjson
+from aiofiles.threadpool.binary import AsyncBufferedReader
 from kosong.base.message import Message
 
 from kimi_cli.soul.message import system
 from kimi_cli.utils.logging import logger
 from kimi_cli.utils.path import next_available_rotation
 
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+async def _iter_lines(f: AsyncBufferedReader) -> AsyncIterator[bytearray]:
+    """Yield the non-blank lines of a binary file, without the trailing newline."""
+    buf = bytearray()
+    while chunk := await f.read(_READ_CHUNK_SIZE):
+        # bytes before `scan_from` are known to hold no newline, so each byte is scanned once
+        scan_from = len(buf)
+        buf += chunk
+        start = 0
+        while (end := buf.find(b"\n", max(start, scan_from))) != -1:
+            line = buf[start:end]
+            start = end + 1
+            if line and not line.isspace():
+                yield line
+        del buf[:start]
+    if buf and not buf.isspace():
+        yield buf
+
 
 class Context:
     def __init__(self, file_backend: Path):
@@ -31,11 +53,9 @@ class Context:
             logger.debug("Empty context file, skipping restoration")
             return False
 
-        async with aiofiles.open(self._file_backend, encoding="utf-8") as f:
-            async for line in f:
-                if not line.strip():
-                    continue
-                line_json = json.loads(line)
+        async with aiofiles.open(self._file_backend, "rb") as f:
+            async for line in _iter_lines(f):
+                line_json = orjson.loads(line)
                 if line_json["role"] == "_usage":
                     self._token_count = line_json["token_count"]
                     continue
@@ -105,18 +125,15 @@ class Context:
         self._token_count = 0
         self._next_checkpoint_id = 0
         async with (
-            aiofiles.open(rotated_file_path, encoding="utf-8") as old_file,
-            aiofiles.open(self._file_backend, "w", encoding="utf-8") as new_file,
+            aiofiles.open(rotated_file_path, "rb") as old_file,
+            aiofiles.open(self._file_backend, "wb") as new_file,
         ):
-            async for line in old_file:
-                if not line.strip():
-                    continue
-
-                line_json = json.loads(line)
+            async for line in _iter_lines(old_file):
+                line_json = orjson.loads(line)
                 if line_json["role"] == "_checkpoint" and line_json["id"] == checkpoint_id:
                     break
 
-                await new_file.write(line)
+                await new_file.write(line + b"\n")
                 if line_json["role"] == "_usage":
                     self._token_count = line_json["token_count"]
                 elif line_json["role"] == "_checkpoint":
@@ -24,14 +24,24 @@ if TYPE_CHECKING:
     from kimi_cli.ui.shell import ShellApp
 
 
+_ROLE_COLORS = {
+    "system": "magenta",
+    "developer": "magenta",
+    "user": "green",
+    "assistant": "blue",
+    "tool": "yellow",
+}
+
+
 def _format_content_part(part: ContentPart) -> Text | Panel | Group:
     """Format a single content part."""
     match part:
         case TextPart(text=text):
             # Check if it looks like a system tag
-            if text.strip().startswith("<system>") and text.strip().endswith("</system>"):
+            stripped = text.strip()
+            if stripped.startswith("<system>") and stripped.endswith("</system>"):
                 return Panel(
-                    text.strip()[8:-9].strip(),
+                    stripped[8:-9].strip(),
                     title="[dim]system[/dim]",
                     border_style="dim yellow",
                     padding=(0, 1),
@@ -87,14 +97,7 @@ def _format_tool_call(tool_call: ToolCall) -> Panel:
 def _format_message(msg: Message, index: int) -> Panel:
     """Format a single message."""
     # Role styling
-    role_colors = {
-        "system": "magenta",
-        "developer": "magenta",
-        "user": "green",
-        "assistant": "blue",
-        "tool": "yellow",
-    }
-    role_color = role_colors.get(msg.role, "white")
+    role_color = _ROLE_COLORS.get(msg.role, "white")
     role_text = f"[bold {role_color}]{msg.role.upper()}[/bold {role_color}]"
 
     # Add name if present
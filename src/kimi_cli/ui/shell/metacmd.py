@@ -1,3 +1,4 @@
+import functools
 import tempfile
 import webbrowser
 from collections.abc import Awaitable, Callable, Sequence
@@ -151,23 +152,27 @@ Meta commands are also available:
 """
 
 
+@functools.lru_cache(maxsize=1)
+def _render_help_panel() -> Panel:
+    # meta commands are all registered at import time, so the panel never changes
+    return Panel(
+        _HELP_MESSAGE_FMT.format(
+            meta_commands_md="\n".join(
+                f" • {command.slash_name()}: {command.description}"
+                for command in get_meta_commands()
+            )
+        ).strip(),
+        title="Kimi CLI Help",
+        border_style="wheat4",
+        expand=False,
+        padding=(1, 2),
+    )
+
+
 @meta_command(aliases=["h", "?"])
 def help(app: "ShellApp", args: list[str]):
     """Show help information"""
-    console.print(
-        Panel(
-            _HELP_MESSAGE_FMT.format(
-                meta_commands_md="\n".join(
-                    f" • {command.slash_name()}: {command.description}"
-                    for command in get_meta_commands()
-                )
-            ).strip(),
-            title="Kimi CLI Help",
-            border_style="wheat4",
-            expand=False,
-            padding=(1, 2),
-        )
-    )
+    console.print(_render_help_panel())
 
 
 @meta_command
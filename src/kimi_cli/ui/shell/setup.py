@@ -91,15 +91,15 @@ class _SetupResult(NamedTuple):
 
 async def _setup() -> _SetupResult | None:
     # select the API platform
-    platform_name = await _prompt_choice(
+    platform_id = await _prompt_choice(
         header="Select the API platform",
-        choices=[platform.name for platform in _PLATFORMS],
+        choices=[(platform.id, platform.name) for platform in _PLATFORMS],
     )
-    if not platform_name:
+    if not platform_id:
         console.print("[red]No platform selected[/red]")
         return None
 
-    platform = next(platform for platform in _PLATFORMS if platform.name == platform_name)
+    platform = next(platform for platform in _PLATFORMS if platform.id == platform_id)
 
     # enter the API key
     api_key = await _prompt_text("Enter your API key", is_password=True)
@@ -139,7 +139,7 @@ async def _setup() -> _SetupResult | None:
 
     model_id = await _prompt_choice(
         header="Select the model",
-        choices=model_ids,
+        choices=[(model_id, model_id) for model_id in model_ids],
     )
     if not model_id:
         console.print("[red]No model selected[/red]")
@@ -155,15 +155,16 @@ async def _setup() -> _SetupResult | None:
     )
 
 
-async def _prompt_choice(*, header: str, choices: list[str]) -> str | None:
+async def _prompt_choice(*, header: str, choices: list[tuple[str, str]]) -> str | None:
+    """Prompt to choose from `(value, label)` pairs, returning the selected value."""
     if not choices:
         return None
 
     try:
         return await ChoiceInput(
             message=header,
-            options=[(choice, choice) for choice in choices],
-            default=choices[0],
+            options=choices,
+            default=choices[0][0],
         ).prompt_async()
     except (EOFError, KeyboardInterrupt):
         return None
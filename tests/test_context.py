@@ -0,0 +1,64 @@
+"""Tests for context history persistence."""
+
+import pytest
+from kosong.base.message import Message
+
+from kimi_cli.soul.context import Context
+
+
+@pytest.mark.asyncio
+async def test_restore_long_lines_and_blank_lines(tmp_path):
+    """Test restoring a history whose lines span read chunks, with blank lines in between."""
+    history_file = tmp_path / "history.jsonl"
+    context = Context(file_backend=history_file)
+    await context.checkpoint(add_user_message=False)
+    await context.append_message(Message(role="user", content="你好"))
+    await context.update_token_count(42)
+    await context.append_message(Message(role="assistant", content="x" * 200_000))
+    with history_file.open("a", encoding="utf-8") as f:
+        f.write("\n  \n")
+
+    restored = Context(file_backend=history_file)
+    assert await restored.restore()
+    assert [message.content for message in restored.history] == ["你好", "x" * 200_000]
+    assert restored.token_count == 42
+    assert restored.n_checkpoints == 1
+
+
+@pytest.mark.asyncio
+async def test_revert_to_checkpoint(tmp_path):
+    """Test reverting rewrites the history file up to the given checkpoint."""
+    history_file = tmp_path / "history.jsonl"
+    context = Context(file_backend=history_file)
+    await context.checkpoint(add_user_message=False)
+    await context.append_message(Message(role="user", content="first"))
+    await context.update_token_count(10)
+    await context.checkpoint(add_user_message=False)
+    await context.append_message(Message(role="user", content="second"))
+
+    await context.revert_to(1)
+    assert [message.content for message in context.history] == ["first"]
+    assert context.token_count == 10
+    assert context.n_checkpoints == 1
+    assert (tmp_path / "history_1.jsonl").exists()
+
+    restored = Context(file_backend=history_file)
+    assert await restored.restore()
+    assert [message.content for message in restored.history] == ["first"]
+    assert restored.token_count == 10
+    assert restored.n_checkpoints == 1
+
+
+@pytest.mark.asyncio
+async def test_restore_last_line_without_newline(tmp_path):
+    """Test restoring a history whose last line has no trailing newline."""
+    history_file = tmp_path / "history.jsonl"
+    history_file.write_text(
+        '{"role": "_checkpoint", "id": 0}\n{"role": "user", "content": "' + "y" * 100_000 + '"}',
+        encoding="utf-8",
+    )
+
+    restored = Context(file_backend=history_file)
+    assert await restored.restore()
+    assert [message.content for message in restored.history] == ["y" * 100_000]
+    assert restored.n_checkpoints == 1
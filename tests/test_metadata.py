@@ -0,0 +1,66 @@
+"""Tests for metadata persistence."""
+
+from pathlib import Path
+
+import pytest
+
+from kimi_cli.metadata import Metadata, WorkDirMeta, load_metadata, save_metadata
+
+
+@pytest.fixture(autouse=True)
+def share_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Redirect the share directory to a temporary directory."""
+    monkeypatch.setattr("kimi_cli.metadata.get_share_dir", lambda: tmp_path)
+    return tmp_path
+
+
+def test_load_metadata_missing_file():
+    """Test loading metadata when the file does not exist."""
+    assert load_metadata() == Metadata()
+
+
+def test_save_and_load_metadata(share_dir: Path):
+    """Test metadata round trip through the file."""
+    metadata = Metadata(work_dirs=[WorkDirMeta(path="/tmp/项目", last_session_id="abc")])
+    save_metadata(metadata)
+
+    assert (share_dir / "kimi.json").exists()
+    assert load_metadata() == metadata
+
+
+def test_sessions_dir(share_dir: Path):
+    """Test the sessions directory is created, and recreated if removed."""
+    work_dir_meta = WorkDirMeta(path="/tmp/project")
+    sessions_dir = work_dir_meta.sessions_dir
+
+    assert sessions_dir.is_dir()
+    assert sessions_dir.parent == share_dir / "sessions"
+    assert WorkDirMeta(path="/tmp/project").sessions_dir == sessions_dir
+
+    sessions_dir.rmdir()
+    assert work_dir_meta.sessions_dir.is_dir()
+    assert work_dir_meta.model_dump() == {"path": "/tmp/project", "last_session_id": None}
+
+
+def test_save_metadata_replaces_file(share_dir: Path):
+    """Test saving metadata replaces the file without leaving a temporary file behind."""
+    save_metadata(Metadata(work_dirs=[WorkDirMeta(path="/a")]))
+    save_metadata(Metadata(work_dirs=[WorkDirMeta(path="/b")]))
+
+    assert [p.name for p in share_dir.iterdir()] == ["kimi.json"]
+    assert [wd.path for wd in load_metadata().work_dirs] == ["/b"]
+
+
+def test_save_metadata_cleans_up_on_failure(share_dir: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test a failed save keeps the old file and removes the temporary file."""
+    save_metadata(Metadata(work_dirs=[WorkDirMeta(path="/a")]))
+
+    def fail_replace(src, dst):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr("kimi_cli.metadata.os.replace", fail_replace)
+    with pytest.raises(OSError, match="replace failed"):
+        save_metadata(Metadata(work_dirs=[WorkDirMeta(path="/b")]))
+
+    assert [p.name for p in share_dir.iterdir()] == ["kimi.json"]
+    assert [wd.path for wd in load_metadata().work_dirs] == ["/a"]